@@ -27,7 +27,9 @@ graph_logger = logging.getLogger("GRAPH")
 #graph_logger.setLevel(logging.INFO)
 #graph_logger.setLevel(logging.WARNING)
 #graph_logger.setLevel(logging.ERROR)
-graph_logger.setLevel(logging.CRITICAL)
+# COMPAT_LIB_DEBUG enables the debug log of the graph module
+if not os.environ.get("COMPAT_LIB_DEBUG"):
+    graph_logger.setLevel(logging.CRITICAL)
 
 parser_logger = logging.getLogger("PARSER")
 #parser_logger.setLevel(logging.DEBUG)
@@ -133,13 +135,13 @@ def calculate_fw_propation(state1: State,
     logger.info("x-------------------------------------------------------------x")
     d_fw_1 = 0
     d_fw_2 = 0
-    if state1.get_outgoing_tau_list() == []:
+    if not state1.get_outgoing_tau_list():
         logger.info("state = {} has no tau".format(state1.get_name()))
         d_fw_1 = obs_comp_state1_state2
     else:
         raise Exception("tau calculation is not yet supported")
     
-    if state2.get_outgoing_tau_list() == []:
+    if not state2.get_outgoing_tau_list():
         logger.info("state = {} has no tau".format(state2.get_name()))
         d_fw_2 = obs_comp_state1_state2
     else:
@@ -161,13 +163,13 @@ def calculate_bw_propation(state1: State,
     logger.info("x-------------------------------------------------------------x")
     d_bw_1 = 0
     d_bw_2 = 0
-    if state1.get_imcoming_tau_list() == []:
+    if not state1.get_imcoming_tau_list():
         logger.info("state = {} has no tau".format(state1.get_name()))
         d_bw_1 = obs_comp_state1_state2
     else:
         raise Exception("tau calculation is not yet supported")
     
-    if state2.get_imcoming_tau_list() == []:
+    if not state2.get_imcoming_tau_list():
         logger.info("state = {} has no tau".format(state2.get_name()))
         d_bw_2 = obs_comp_state1_state2
     else:
@@ -227,14 +229,14 @@ def calculate_w1_w2_w3(state1:State, state2:State) -> tuple:
     w2 = 0
     w3 = 0
     
-    if (state1.get_imcoming_tau_list() == [] and state2.get_imcoming_tau_list() == [] and
-        state1.get_outgoing_tau_list() == [] and state2.get_outgoing_tau_list() == []):
+    if (not state1.get_imcoming_tau_list() and not state2.get_imcoming_tau_list() and
+        not state1.get_outgoing_tau_list() and not state2.get_outgoing_tau_list()):
         w3 = 1
     else:
         raise Exception("tau is not supported")
  
-    w1 = len(state1.get_outgoing_transitions_list()) + len(state2.get_outgoing_transitions_list())
-    w2 = len(state1.get_incoming_transitions_list()) + len(state2.get_incoming_transitions_list())
+    w1 = state1.num_outgoing + state2.num_outgoing
+    w2 = state1.num_incoming + state2.num_incoming
     
     logger.info("w1 = {}, w2 = {}, w3 = {}".format(w1, w2, w3))
     
@@ -267,8 +269,8 @@ def calculate_w1_w2_w3_ver2(state1:State, state2:State) -> tuple:
                 logger.debug("    -->best matching outgoing found({},{})".format(outgoing1.name,outgoing2.name ))
                 num_of_best_matching_outgoing += 1
 
-    if (state1.get_imcoming_tau_list() == [] and state2.get_imcoming_tau_list() == [] and
-        state1.get_outgoing_tau_list() == [] and state2.get_outgoing_tau_list() == []):
+    if (not state1.get_imcoming_tau_list() and not state2.get_imcoming_tau_list() and
+        not state1.get_outgoing_tau_list() and not state2.get_outgoing_tau_list()):
         w3 = 1
     else:
         raise Exception("tau is not supported")
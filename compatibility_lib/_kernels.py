@@ -0,0 +1,172 @@
+#!/usr/bin/env python
+
+__author__ = "Quang Hai, Nguyen"
+__copyright__ = "Copyright 2023, Protocol Compatibility Measurement"
+__credits__ = ["Quang Hai, Nguyen"]
+__license__ = "GPL"
+__version__ = "0.0.1"
+__maintainer__ = "Quang Hai"
+__email__ = "hai.nguyen.quang@outlook.com"
+__status__ = "Development"
+
+"""Traversal kernels working on the columnar (CSR) view of the graphs, see
+Graph.freeze() and Graph.get_csr().
+
+The kernels are compiled with numba if it is installed. Without numba, they
+run as plain python functions with the same results.
+"""
+
+import numpy as np
+from .graph import TransitionType
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback when numba is not installed, return the function as is
+        """
+        def decorator(function):
+            return function
+        return decorator
+
+# the kernels work on the integer values of TransitionType
+TAU = int(TransitionType.TAU)
+
+BFS_MATCH_SIGNATURE = ("int32[:,::1](int32[::1], int32[::1], int8[::1], int32[::1], "
+                       "int32[::1], int32[::1], int8[::1], int32[::1], int32, int32)")
+
+
+@njit(BFS_MATCH_SIGNATURE, cache=True)
+def bfs_match(offsets_a, dst_a, type_a, name_a,
+              offsets_b, dst_b, type_b, name_b,
+              start_a, start_b):
+    """Breadth first search over the product of two graphs
+
+    Starting from the pair (start_a, start_b), a pair of states (a, b) moves to
+    (next_a, next_b) if a has a transition and b has a transition with the same
+    name and the opposite direction, i.e., one is emission and the other is
+    reception. A tau transition moves only the graph it belongs to.
+
+    The inputs are not checked, an invalid start index reads or writes out of
+    the arrays. Use bfs_match_graphs() unless the inputs are known to be valid.
+
+    Args:
+        offsets_a (int32[::1]): outgoing edges offsets of the first graph
+        dst_a (int32[::1]): next state index of the edges of the first graph
+        type_a (int8[::1]): transition type of the edges of the first graph
+        name_a (int32[::1]): transition name id of the edges of the first graph
+        offsets_b (int32[::1]): outgoing edges offsets of the second graph
+        dst_b (int32[::1]): next state index of the edges of the second graph
+        type_b (int8[::1]): transition type of the edges of the second graph
+        name_b (int32[::1]): transition name id of the edges of the second graph
+        start_a (int32): index of the start state in the first graph
+        start_b (int32): index of the start state in the second graph
+
+    Returns:
+        int32[:,::1]: reachable pairs of state indexes in visiting order
+    """
+    num_of_states_a = offsets_a.shape[0] - 1
+    num_of_states_b = offsets_b.shape[0] - 1
+
+    visited = np.zeros(num_of_states_a * num_of_states_b, dtype=np.bool_)
+    pairs = np.empty((num_of_states_a * num_of_states_b, 2), dtype=np.int32)
+
+    pairs[0, 0] = start_a
+    pairs[0, 1] = start_b
+    visited[start_a * num_of_states_b + start_b] = True
+    head = 0
+    tail = 1
+
+    # the found pairs are also the queue of the search
+    while head < tail:
+        a = pairs[head, 0]
+        b = pairs[head, 1]
+        head += 1
+
+        for edge_a in range(offsets_a[a], offsets_a[a + 1]):
+            next_a = dst_a[edge_a]
+            if next_a < 0:
+                continue
+
+            if type_a[edge_a] == TAU:
+                next_pair = next_a * num_of_states_b + b
+                if not visited[next_pair]:
+                    visited[next_pair] = True
+                    pairs[tail, 0] = next_a
+                    pairs[tail, 1] = b
+                    tail += 1
+                continue
+
+            for edge_b in range(offsets_b[b], offsets_b[b + 1]):
+                next_b = dst_b[edge_b]
+                if (next_b < 0 or type_b[edge_b] == TAU or
+                        type_b[edge_b] == type_a[edge_a] or
+                        name_b[edge_b] != name_a[edge_a]):
+                    continue
+
+                next_pair = next_a * num_of_states_b + next_b
+                if not visited[next_pair]:
+                    visited[next_pair] = True
+                    pairs[tail, 0] = next_a
+                    pairs[tail, 1] = next_b
+                    tail += 1
+
+        for edge_b in range(offsets_b[b], offsets_b[b + 1]):
+            next_b = dst_b[edge_b]
+            if next_b < 0 or type_b[edge_b] != TAU:
+                continue
+
+            next_pair = a * num_of_states_b + next_b
+            if not visited[next_pair]:
+                visited[next_pair] = True
+                pairs[tail, 0] = a
+                pairs[tail, 1] = next_b
+                tail += 1
+
+    return pairs[:tail].copy()
+
+
+def bfs_match_graphs(graph_a, graph_b, start_a, start_b) -> np.ndarray:
+    """Breadth first search over the product of two graphs, see bfs_match()
+
+    The kernel does not check its inputs, this wrapper validates the start
+    states before calling it.
+
+    Args:
+        graph_a (Graph): first graph
+        graph_b (Graph): second graph
+        start_a (str or int): name or index of the start state in the first graph
+        start_b (str or int): name or index of the start state in the second graph
+
+    Raises:
+        ValueError: a start state is not part of its graph
+
+    Returns:
+        np.ndarray: reachable pairs of state indexes in visiting order, shape (n, 2)
+    """
+    # the name ids are only comparable if both graphs use the same mapping
+    name_ids = {}
+    csr_a = graph_a.get_csr(name_ids)
+    csr_b = graph_b.get_csr(name_ids)
+    num_of_states_a = len(csr_a[0]) - 1
+    num_of_states_b = len(csr_b[0]) - 1
+
+    if num_of_states_a == 0 or num_of_states_b == 0:
+        return np.empty((0, 2), dtype=np.int32)
+
+    start_a = _get_start_index(graph_a, start_a, num_of_states_a)
+    start_b = _get_start_index(graph_b, start_b, num_of_states_b)
+
+    return bfs_match(*csr_a, *csr_b, start_a, start_b)
+
+
+def _get_start_index(graph, start, num_of_states: int) -> int:
+    if isinstance(start, str):
+        index = graph.get_state_index(start)
+    else:
+        index = start
+
+    if index is None or not 0 <= index < num_of_states:
+        raise ValueError("unknown start [state = {}]".format(start))
+
+    return int(index)
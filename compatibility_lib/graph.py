@@ -14,68 +14,143 @@ The module parser will read the data from the json files and create graph,
 states, and transitions based on this module.
 """
 
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 import logging
+import os
+import sys
+import numpy as np
 
 # create logger
 logger = logging.getLogger("GRAPH")
 
-logger.setLevel(logging.DEBUG)
+#logger.setLevel(logging.DEBUG)
 #logger.setLevel(logging.INFO)
-#logger.setLevel(logging.WARNING)
+logger.setLevel(logging.WARNING)
 #logger.setLevel(logging.ERROR)
 #logger.setLevel(logging.CRITICAL)
 
-# create console handler and set level to debug
-ch = logging.StreamHandler()
-ch.setLevel(logging.DEBUG)
+def _setup_debug_handler():
+    """Log everything to the console, enabled with the environment variable
+    COMPAT_LIB_DEBUG
+    """
+    logger.setLevel(logging.DEBUG)
 
-# create formatter
-formatter = logging.Formatter('%(name)s - %(funcName)s - %(levelname)s - %(message)s')
+    # create console handler and set level to debug
+    ch = logging.StreamHandler()
+    ch.setLevel(logging.DEBUG)
 
-# add formatter to ch
-ch.setFormatter(formatter)
+    # create formatter
+    formatter = logging.Formatter('%(name)s - %(funcName)s - %(levelname)s - %(message)s')
 
-# add ch to logger
-logger.addHandler(ch)
+    # add formatter to ch
+    ch.setFormatter(formatter)
 
-class TransitionType(Enum):
+    # add ch to logger
+    logger.addHandler(ch)
+
+if os.environ.get("COMPAT_LIB_DEBUG"):
+    _setup_debug_handler()
+
+# IntEnum members compare as plain integers and can be used as array
+# indexes. str() and format() print the member name as Enum does, on every
+# python version, for the reports.
+class TransitionType(IntEnum):
     TAU = auto()
     EMISSION = auto()
     RECEPTION = auto()
 
-class StateType(Enum):
+    __str__ = Enum.__str__
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+class StateType(IntEnum):
     INIT = auto()
     FINAL = auto()
     NORMAL = auto()
 
+    __str__ = Enum.__str__
+
+    def __format__(self, format_spec):
+        return format(str(self), format_spec)
+
+class IllegalTauParamsError(ValueError):
+    """Tau transition has a list of parameters"""
+
+class IllegalParamError(ValueError):
+    """Parameter of a transition is not "name:data_type" or (name, data_type)"""
+
+class InitHasIncomingError(ValueError):
+    """Initial state has incoming transitions"""
+
+class FinalHasOutgoingError(ValueError):
+    """Final state has outgoing transitions"""
+
 class Transition():
+    __slots__ = ("name", "type", "next_state", "params",
+                 "_param_types", "_data_types")
+
     def __init__(self, name: str,
                  type: TransitionType,
                  next_state: str,
-                 params: list = []) -> None:
+                 params: tuple = ()) -> None:
         """__init__ constructore for Transition class
 
         Args:
             name (str): name of the transition
             type (TransitionType): type of the transition
             next_state (str): name of the next state, where the transition going to
-            params (list, optional): parameter list of the transiotion.
-                                    Defaults to []. For TAU transition, this argument
-                                    must be []
+            params (tuple, optional): parameter list of the transiotion, either
+                                    "name:data_type" strings or (name, data_type)
+                                    tuples. It is stored as (name, data_type)
+                                    tuples. Defaults to (). For TAU transition,
+                                    this argument must be empty
 
         Raises:
-            Exception: Tau transition has list of parameters, i.e., params is
-                        not empty
+            IllegalTauParamsError: Tau transition has list of parameters, i.e.,
+                                   params is not empty
+            IllegalParamError: A parameter does not have the format
+                               "name:data_type" or (name, data_type)
         """
+        if params and type is TransitionType.TAU:
+            raise IllegalTauParamsError("Illegal transition. tau has no parameters list")
           
-        self.name = name
+        # names and data types repeat across the graph, interning them lets
+        # all transitions share one string object and compare by identity first
+        self.name = sys.intern(name)
         self.type = type
-        self.next_state = next_state
-        self.params = params
-        
-        if self.type == TransitionType.TAU and params:
-            raise Exception("Illegal transition. tau has no parameters list")
+        self.next_state = sys.intern(next_state)
+
+        if not params:
+            # fast path, e.g., for tau transitions
+            self.params = ()
+            self._param_types = {}
+            self._data_types = []
+            return
+
+        # immutable copy, transitions must not share the caller's list
+        self.params = tuple(self._parse_param(param) for param in params)
+        self._param_types = dict(self.params)
+
+        # dict keeps the insertion order, so this removes the duplicated data
+        # types in one pass instead of a "not in list" check per parameter
+        self._data_types = list(dict.fromkeys(data_type for _, data_type in self.params))
+
+    @staticmethod
+    def _parse_param(param) -> tuple:
+        # the "name:data_type" strings of the json file are split only once
+        if isinstance(param, str):
+            fields = param.split(":", 1)
+        elif isinstance(param, (tuple, list)):
+            fields = param
+        else:
+            fields = ()
+
+        if len(fields) != 2 or not all(isinstance(field, str) and field for field in fields):
+            raise IllegalParamError("Illegal parameter {!r}, expected \"name:data_type\" "
+                                    "or (name, data_type)".format(param))
+
+        return (sys.intern(fields[0]), sys.intern(fields[1]))
 
     def get_param_type(self, param_name: str) -> str:
         """Get the data type of a parameter
@@ -86,17 +161,13 @@ class Transition():
         Returns:
             str: data type or None
         """
-        data_type = None
-        logger.debug("get data type of [parameter = {}]".format(param_name))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("get data type of [parameter = %s]", param_name)
         
-        if self.params:
-            for param in self.params:
-                if param_name in param:
-                    data_type = param.split(":")[1]
-        else:
+        if not self.params:
             logger.warning("parameters list is empty")
             
-        return data_type
+        return self._param_types.get(param_name)
     
     def get_data_types(self)-> list:
         """Get list of data type of the transition
@@ -104,18 +175,19 @@ class Transition():
         Returns:
             list: list of data type or None
         """
-        data_types = []
-        if self.params:
-            for param in self.params:
-                # Only get this type if it is not duplicated
-                if param.split(":")[1] not in data_types:
-                    data_types.append(param.split(":")[1])        
-        else:
+        if not self.params and logger.isEnabledFor(logging.WARNING):
             logger.warning("parameters list is empty")
         
-        return data_types
+        # copy, so the caller cannot modify the cached list
+        return list(self._data_types)
 
 class State():
+    __slots__ = ("_name", "_type", "_is_initial", "_is_final",
+                 "_incoming", "_outgoing", "_in", "_out",
+                 "_in_cache", "_out_cache",
+                 "_incoming_by_name", "_outgoing_by_name",
+                 "_in_set", "_out_keys", "_graphs")
+
     def __init__(self, name: str,
                  type: StateType,
                  incoming: list = None,
@@ -128,62 +200,124 @@ class State():
             outgoing (list, optional): Outgoing transition. Defaults to None.
 
         Raises:
-            Exception: Initial state does not have incoming transition
-            Exception: Final state does not have outgoing transition
+            InitHasIncomingError: Initial state does not have incoming transition
+            FinalHasOutgoingError: Final state does not have outgoing transition
         """
-        self._name = name
+        self._name = sys.intern(name)
         self._type = type
+        # the type does not change, so the checks are done only once
+        self._is_initial = type is StateType.INIT
+        self._is_final = type is StateType.FINAL
         
-        if incoming == None:
-            self._incoming = []
-        else:
-            self._incoming = incoming
-            
-        if outgoing == None:
-            self._outgoing = []
-        else:
-            self._outgoing = outgoing 
-        
-        if (self._type == StateType.INIT) and (self._incoming != []):
-            raise Exception("Initial state does not have incoming transition")
+        if self._is_initial and incoming:
+            raise InitHasIncomingError("Initial state does not have incoming transition")
     
-        if (self._type == StateType.FINAL) and (self._outgoing != []):
-            logger.debug("outgoing transition = {}".format(self._outgoing))
-            raise Exception("Final state does not have outgoing transition")
+        if self._is_final and outgoing:
+            logger.debug("outgoing transition = %s", outgoing)
+            raise FinalHasOutgoingError("Final state does not have outgoing transition")
+
+        self._incoming = []
+        self._outgoing = []
+
+        # transitions bucketed by type at insertion time, so the per type
+        # getters do not have to filter the whole list on every call
+        self._in = {TransitionType.TAU: [],
+                    TransitionType.EMISSION: [],
+                    TransitionType.RECEPTION: []}
+        self._out = {TransitionType.TAU: [],
+                     TransitionType.EMISSION: [],
+                     TransitionType.RECEPTION: []}
+
+        # read-only tuples of the buckets, built on first use and dropped
+        # when a transition of the type is added
+        self._in_cache = dict.fromkeys(TransitionType)
+        self._out_cache = dict.fromkeys(TransitionType)
+
+        # transitions indexed by name, the first transition added with a given
+        # name wins as it did with the linear search
+        self._incoming_by_name = {}
+        self._outgoing_by_name = {}
+
+        # already added transitions. Incoming transitions come from different
+        # states and can share name and next state, so they are only unique
+        # as objects. Outgoing transitions are unique by name, type and next
+        # state.
+        self._in_set = set()
+        self._out_keys = set()
+
+        # graphs the state was added to, their columnar view is dropped when
+        # an outgoing transition is added
+        self._graphs = []
+
+        if incoming != None:
+            for transition in incoming:
+                self._append_incoming(transition)
+
+        if outgoing != None:
+            for transition in outgoing:
+                self._append_outgoing(transition)
+
+    def _append_incoming(self, transition: Transition) -> bool:
+        if transition in self._in_set:
+            return False
+        
+        self._in_set.add(transition)
+        self._incoming.append(transition)
+        self._in[transition.type].append(transition)
+        self._in_cache[transition.type] = None
+        self._incoming_by_name.setdefault(transition.name, transition)
+        return True
+
+    def _append_outgoing(self, transition: Transition) -> bool:
+        key = (transition.name, transition.type, transition.next_state)
+        if key in self._out_keys:
+            return False
+        
+        self._out_keys.add(key)
+        self._outgoing.append(transition)
+        self._out[transition.type].append(transition)
+        self._out_cache[transition.type] = None
+        self._outgoing_by_name.setdefault(transition.name, transition)
+        for graph in self._graphs:
+            if graph._edges is not None:
+                graph._unfreeze()
+        return True
 
     def add_incoming_transition(self, transition: Transition):
-        """Add an incoming transition
+        """Add an incoming transition, a transition already added is ignored
 
         Args:
             transition (Transition): transition to be added
-
-        Raises:
-            Exception: Initial state does not have incoming transition
         """
         if transition is None:
             return
         
-        self._incoming.append(transition)
-        logger.debug("add new incoming transition [name = {}]".format(transition.name))
+        if self._append_incoming(transition):
+            logger.debug("add new incoming transition [name = %s]", transition.name)
+        else:
+            logger.warning("ignore duplicated incoming transition [name = %s] of [state = %s]",
+                           transition.name, self._name)
         
     
     def add_outgoing_transition(self, transition: Transition):
-        """Add an outgoing transition
+        """Add an outgoing transition, a transition with the same name, type and
+        next state as an already added one is ignored
 
         Args:
             transition (Transition): transition to be added
 
         Raises:
-            Exception: Final state does not have outgoing transition
+            FinalHasOutgoingError: Final state does not have outgoing transition
         """
         if transition is None:
             return
         
-        logger.debug("add new outgoing transition [name = {}]".format(transition.name))
-        if self._type == StateType.FINAL:
-            raise Exception("Final state does not have outgoing transition")
-        else:
-            self._outgoing.append(transition)
+        logger.debug("add new outgoing transition [name = %s]", transition.name)
+        if self._is_final:
+            raise FinalHasOutgoingError("Final state does not have outgoing transition")
+        elif not self._append_outgoing(transition):
+            logger.warning("ignore duplicated outgoing transition [name = %s] of [state = %s]",
+                           transition.name, self._name)
     
     def get_incoming_transtition(self, name: str) -> Transition:
         """Get an incoming transition
@@ -194,18 +328,9 @@ class State():
         Returns:
             Transition: incoming transition
         """
-        logger.debug("get incoming transition [name = {}]".format(name))
-        ret_transition = None
-        
-        if self._type != StateType.INIT:
-            for transition in self._incoming:
-                if name == transition.name:
-                    ret_transition = transition
-                    logger.debug("transition found")
-                    break
-        else:
-            logger.warning("Initial state has no incoming transitions")
-        return ret_transition
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("get incoming transition [name = %s]", name)
+        return self._incoming_by_name.get(name)
     
     def get_outgoing_transtition(self, name: str) -> Transition:
         """Get out going transition
@@ -216,25 +341,16 @@ class State():
         Returns:
             Transition: outgoing transition
         """
-        logger.debug("get outgoing transition [name = {}]".format(name))
-        ret_transition = None
-        
-        if self._type != StateType.FINAL:
-            for transition in self._outgoing:
-                if name == transition.name:
-                    ret_transition = transition
-                    logger.debug("transition found")
-                    break
-        else:
-            logger.warning("Final state has no outgoing transitions")
-                    
-        return ret_transition
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("get outgoing transition [name = %s]", name)
+        return self._outgoing_by_name.get(name)
     
     def get_incoming_transitions_list(self) -> list:
         """Get the list on incoming transitions
 
         Returns:
-            list: incoming transitions list
+            list: incoming transitions list, read-only. Use add_incoming_transition()
+                  to add a transition
         """
         return self._incoming
     
@@ -242,74 +358,73 @@ class State():
         """Get the list of outgoing transitions
 
         Returns:
-            list: outgoing transitions list
+            list: outgoing transitions list, read-only. Use add_outgoing_transition()
+                  to add a transition
         """
         return self._outgoing
         
     
-    def get_outgoing_emission_list(self) -> list:
-        """Return the list of outgoing emission transition
+    @staticmethod
+    def _get_cached(cache: dict, buckets: dict, transition_type: TransitionType) -> tuple:
+        transitions = cache[transition_type]
+        if transitions is None:
+            transitions = tuple(buckets[transition_type])
+            cache[transition_type] = transitions
+        return transitions
+    
+    def get_outgoing_emission_list(self) -> tuple:
+        """Return the outgoing emission transitions
 
         Returns:
-            list: emission transition
+            tuple: emission transition, read-only
         """
-        emission = []
-        
-        for transition in self._outgoing:
-            if transition.type == TransitionType.EMISSION:
-                emission.append(transition)
-
-        return emission
+        return self._get_cached(self._out_cache, self._out, TransitionType.EMISSION)
     
     
-    def get_outgoing_reception_list(self) -> list:
-        """Return the list of outgoing reception transition
+    def get_outgoing_reception_list(self) -> tuple:
+        """Return the outgoing reception transitions
 
         Returns:
-            list: reception transition
+            tuple: reception transition, read-only
         """
-        reception = []
-        
-        for transition in self._outgoing:
-            if transition.type == TransitionType.RECEPTION:
-                reception.append(transition)
-
-        return reception
+        return self._get_cached(self._out_cache, self._out, TransitionType.RECEPTION)
     
     
-    def get_outgoing_tau_list(self):
-        """Return the list of outgoing tau transition
+    def get_outgoing_tau_list(self) -> tuple:
+        """Return the outgoing tau transitions
 
         Returns:
-            list: tau transition
+            tuple: tau transition, read-only
         """
-        tau = []
-        
-        for transition in self._outgoing:
-            if transition.type == TransitionType.TAU:
-                tau.append(transition)
-
-        return tau
+        return self._get_cached(self._out_cache, self._out, TransitionType.TAU)
     
     
-    def get_imcoming_tau_list(self):
-        """Return the list of incoming tau transition
+    def get_imcoming_tau_list(self) -> tuple:
+        """Return the incoming tau transitions
 
         Returns:
-            list: tau transition
+            tuple: tau transition, read-only
         """
-        tau = []
-        
-        for transition in self._incoming:
-            if transition.type == TransitionType.TAU:
-                tau.append(transition)
-
-        return tau
+        return self._get_cached(self._in_cache, self._in, TransitionType.TAU)
 
     
+    @property
+    def num_incoming(self) -> int:
+        """Number of incoming transitions
+        """
+        return len(self._incoming)
+    
+    @property
+    def num_outgoing(self) -> int:
+        """Number of outgoing transitions
+        """
+        return len(self._outgoing)
+    
     def get_num_of_incoming_transistions(self) -> int:
         """Get number of incoming transition
 
+        Deprecated, use the num_incoming property.
+
         Returns:
             int: number of transitions
         """
@@ -318,7 +433,7 @@ class State():
     def get_num_of_outgoing_transitions(self) -> int:
         """Get number of outgoing transition
 
-        _extended_summary_
+        Deprecated, use the num_outgoing property.
 
         Returns:
             int: number of transitions
@@ -331,12 +446,10 @@ class State():
         Returns:
             bool: True if final state
         """
-        if self._type == StateType.FINAL:
-            logger.debug("[state = {}] is FINAL state".format(self._name))
-            return True
-        else:
-            logger.debug("[state = {}] is NOT FINAL state".format(self._name))
-            return False
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[state = %s] is %sFINAL state", self._name,
+                         "" if self._is_final else "NOT ")
+        return self._is_final
     
     def is_initial_state(self) -> bool:
         """check if state is initial state
@@ -344,12 +457,10 @@ class State():
         Returns:
             bool: True if initial state
         """
-        if self._type == StateType.INIT:
-            logger.debug("[state = {}] is INIT state".format(self._name))
-            return True
-        else:
-            logger.debug("[state = {}] is NOT INIT state".format(self._name))
-            return False
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[state = %s] is %sINIT state", self._name,
+                         "" if self._is_initial else "NOT ")
+        return self._is_initial
         
     def get_name(self) -> str:
         """Get name of the state
@@ -359,34 +470,43 @@ class State():
         """
         return self._name
     
-    def print_state(self):
-        print("*************************************************************")
-        print("State report")
-        print("Name: {}".format(self._name))
-        print("Type: {}".format(self._type))
-        
-        print("Incoming Transitions:")
-        for transition in self._incoming:
-            print("    ---------------------------------------")
-            print("    Name: {}".format(transition.name))
-            print("    Type: {}".format(transition.type))
-            print("    num of params: {}".format(len(transition.params)))
-            print("    params:")
-            for param in transition.params:
-                print("        {}".format(param))
+    def get_report(self) -> str:
+        """Get the report of the state and its transitions
+
+        Returns:
+            str: report, one line per property
+        """
+        lines = ["*************************************************************",
+                 "State report",
+                 f"Name: {self._name}",
+                 f"Type: {self._type}",
+                 "Incoming Transitions:"]
+        self._add_transitions_report(lines, self._incoming)
+        lines.append("Outgoing Transitions:")
+        self._add_transitions_report(lines, self._outgoing)
         
-        print("Outgoing Transitions:")
-        for transition in self._outgoing:
-            print("    ---------------------------------------")
-            print("    Name: {}".format(transition.name))
-            print("    Type: {}".format(transition.type))
-            print("    num of params: {}".format(len(transition.params)))
-            print("    params:")
-            for param in transition.params:
-                print("        {}".format(param))
+        return "\n".join(lines)
+    
+    @staticmethod
+    def _add_transitions_report(lines: list, transitions: list):
+        for transition in transitions:
+            lines.append("    ---------------------------------------")
+            lines.append(f"    Name: {transition.name}")
+            lines.append(f"    Type: {transition.type}")
+            lines.append(f"    num of params: {len(transition.params)}")
+            lines.append("    params:")
+            for param_name, data_type in transition.params:
+                lines.append(f"        {param_name}:{data_type}")
+    
+    def print_state(self):
+        sys.stdout.write(self.get_report() + "\n")
             
             
 class Graph():
+    __slots__ = ("_name", "_states", "_state_by_name", "_state_index",
+                 "_edges", "_edge_type", "_edge_src", "_edge_dst",
+                 "_edge_name_id", "_edge_names", "_out_offsets")
+
     def __init__(self, name: str, states: list = None) -> None:
 
         """Constructor of Graph class
@@ -400,7 +520,19 @@ class Graph():
         if states == None:
             self._states = []
         else:
-            self._states = states
+            # copy, the index below must not go stale if the caller changes
+            # the list
+            self._states = list(states)
+
+        # index of the states by name, the list is kept for the ordering
+        self._state_by_name = {}
+        # the first state with a given name wins as it did with the linear search
+        for state in self._states:
+            self._state_by_name.setdefault(state.get_name(), state)
+            state._graphs.append(self)
+
+        # columnar view of the transitions, built by freeze()
+        self._unfreeze()
         
     def add_state(self, state: State):
         """Add new state to the graph
@@ -409,8 +541,11 @@ class Graph():
             state (State): new state
         """
         if state != None:
-            logger.debug("add [state = {}] to graph".format(state.get_name()))
+            logger.debug("add [state = %s] to graph", state.get_name())
             self._states.append(state)
+            self._state_by_name.setdefault(state.get_name(), state)
+            state._graphs.append(self)
+            self._unfreeze()
         
     def get_state(self, state_name: str) ->State:
         """Get a state
@@ -421,43 +556,201 @@ class Graph():
         Returns:
             State: state or None
         """
-        logger.debug("looking for [state = {}]".format(state_name))
-        ret_state = None
-    
-        for state in self._states:
-            if state_name == state.get_name():
-                ret_state = state
-                logger.debug("state found")
-                break
-            else:
-                pass
-        
-        if ret_state == None:
-            logger.warning("state not found")
+        ret_state = self._state_by_name.get(state_name)
+
+        if ret_state == None and logger.isEnabledFor(logging.WARNING):
+            logger.warning("state not found [state = %s]", state_name)
         return ret_state
     
     def get_states_list(self) -> list:
         """Get all the states of the graph
 
         Returns:
-            list: state list
+            list: state list, read-only. Use add_state() to add a state
         """
         return self._states
+
+    def _unfreeze(self):
+        """Drop the columnar view, it is out of date after the graph changed
+        """
+        self._state_index = None
+        self._edges = None
+        self._edge_type = None
+        self._edge_src = None
+        self._edge_dst = None
+        self._edge_name_id = None
+        self._edge_names = None
+        self._out_offsets = None
+
+    def is_frozen(self) -> bool:
+        """Check if the columnar view of the graph is built
+
+        Returns:
+            bool: True if freeze() was called after the last change of the graph
+        """
+        return self._edges is not None
+
+    def freeze(self):
+        """Build a columnar (CSR) view of the outgoing transitions
+
+        The outgoing transitions of all states are stored in flat numpy arrays,
+        ordered by source state. The outgoing transitions of the state with
+        index i are the edges _out_offsets[i]:_out_offsets[i + 1]. Adding a state
+        or an outgoing transition afterwards drops the view, it is rebuilt by
+        the getters below.
+        """
+        self._state_index = {}
+        for index, state in enumerate(self._states):
+            self._state_index[state.get_name()] = index
+
+        edges = []
+        edge_src = []
+        out_offsets = [0]
+        for index, state in enumerate(self._states):
+            for transition in state.get_outgoing_transitions_list():
+                edges.append(transition)
+                edge_src.append(index)
+            out_offsets.append(len(edges))
+
+        num_of_edges = len(edges)
+        self._edges = edges
+        self._edge_type = np.fromiter((transition.type for transition in edges),
+                                      dtype=np.int8, count=num_of_edges)
+        self._edge_src = np.array(edge_src, dtype=np.int32)
+        # -1 if the next state is not part of the graph
+        self._edge_dst = np.fromiter((self._state_index.get(transition.next_state, -1)
+                                      for transition in edges),
+                                     dtype=np.int32, count=num_of_edges)
+        # ids of the names are local to the graph, _edge_names[id] is the name
+        name_ids = {}
+        self._edge_name_id = np.fromiter((name_ids.setdefault(transition.name, len(name_ids))
+                                          for transition in edges),
+                                         dtype=np.int32, count=num_of_edges)
+        self._edge_names = list(name_ids)
+        self._out_offsets = np.array(out_offsets, dtype=np.int32)
+        logger.debug("freeze [graph = %s] with [num of edges = %s]", self._name, num_of_edges)
+
+    def get_state_index(self, state_name: str) -> int:
+        """Get the index of a state in the columnar view
+
+        Args:
+            state_name (str): name of the state
+
+        Returns:
+            int: index of the state or None
+        """
+        if not self.is_frozen():
+            self.freeze()
+        return self._state_index.get(state_name)
+
+    def get_edge(self, edge_index: int) -> Transition:
+        """Get the transition of an edge in the columnar view
+
+        Args:
+            edge_index (int): index of the edge
+
+        Returns:
+            Transition: transition of the edge
+        """
+        if not self.is_frozen():
+            self.freeze()
+        return self._edges[edge_index]
+
+    def get_csr(self, name_ids: dict = None) -> tuple:
+        """Get the arrays of the columnar view, used by the traversal kernels
+
+        Args:
+            name_ids (dict, optional): ids of the transition names, shared by the
+                                       graphs being compared. Names not in it yet
+                                       are added. Defaults to None, i.e., the ids
+                                       are local to this graph
+
+        Returns:
+            tuple: outgoing offsets, next state indexes, transition types and
+                   transition name ids of the edges
+        """
+        if not self.is_frozen():
+            self.freeze()
+
+        if name_ids == None:
+            edge_name_id = self._edge_name_id
+        else:
+            # map the local ids to the shared ones, equal names get equal ids
+            shared_ids = np.fromiter((name_ids.setdefault(name, len(name_ids))
+                                      for name in self._edge_names),
+                                     dtype=np.int32, count=len(self._edge_names))
+            edge_name_id = shared_ids[self._edge_name_id]
+
+        return (self._out_offsets, self._edge_dst, self._edge_type, edge_name_id)
+
+    def outgoing_of_type(self, state_index: int, transition_type: TransitionType) -> np.ndarray:
+        """Get the outgoing edges of a state with a given type
+
+        Args:
+            state_index (int): index of the state, see get_state_index()
+            transition_type (TransitionType): type of the transitions
+
+        Returns:
+            np.ndarray: indexes of the edges, see get_edge()
+        """
+        if not self.is_frozen():
+            self.freeze()
+        low = self._out_offsets[state_index]
+        high = self._out_offsets[state_index + 1]
+        return low + np.flatnonzero(self._edge_type[low:high] == transition_type)
     
+    def to_igraph(self):
+        """Export the graph to igraph, to run the analysis with its C core
+
+        The vertices are the states in the order of the state list, with the
+        attributes "name" and "type". The edges are the outgoing transitions,
+        with the attributes "name", "ttype" and "params". Transitions to a state
+        which is not part of the graph are skipped. igraph is only imported
+        here, it is not needed for the rest of the module.
+
+        Returns:
+            igraph.Graph: directed graph
+        """
+        import igraph
+
+        if not self.is_frozen():
+            self.freeze()
+
+        known = self._edge_dst >= 0
+        if not known.all() and logger.isEnabledFor(logging.WARNING):
+            logger.warning("skip [num of edges = %s] to unknown states",
+                           len(known) - np.count_nonzero(known))
+
+        edges = [self._edges[index] for index in np.flatnonzero(known)]
+        ig_graph = igraph.Graph(n=len(self._states),
+                                edges=np.column_stack((self._edge_src[known],
+                                                       self._edge_dst[known])).tolist(),
+                                directed=True)
+        ig_graph["name"] = self._name
+        ig_graph.vs["name"] = [state.get_name() for state in self._states]
+        ig_graph.vs["type"] = [state._type for state in self._states]
+        ig_graph.es["name"] = [transition.name for transition in edges]
+        ig_graph.es["ttype"] = [transition.type for transition in edges]
+        ig_graph.es["params"] = [transition.params for transition in edges]
+        return ig_graph
+
     def print_graph(self):
-        print()
-        print("####################################################################################")
-        print("#")
-        print("# Graph Name: {}".format(self._name))
-        print("# Number of states: {}".format(len(self._states)))
-        print("#")
-        print("####################################################################################")
-        print("#")
+        lines = ["",
+                 "####################################################################################",
+                 "#",
+                 f"# Graph Name: {self._name}",
+                 f"# Number of states: {len(self._states)}",
+                 "#",
+                 "####################################################################################",
+                 "#"]
         for state in self._states:
-            state.print_state()
-        print("#")
-        print("####################################################################################")
-        print()
+            lines.append(state.get_report())
+        lines += ["#",
+                  "####################################################################################",
+                  ""]
+        
+        # one write for the whole report instead of one print per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
         
     
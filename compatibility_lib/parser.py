@@ -117,6 +117,11 @@ def is_transaction_valid(transaction_dict: dict) -> bool:
         logger.error("params has wrong property invalid")
         return False
     
+    for param in transaction_dict[TRANSITION_PARAM_KEY]:
+        if type(param) != str or param.count(":") != 1 or param.startswith(":") or param.endswith(":"):
+            logger.error("param = {} must have the format param_name:data_type".format(param))
+            return False
+    
     if TRANSITION_NEXT_STATE_KEY in transaction_dict and transaction_dict[TRANSITION_NEXT_STATE_KEY] != "":
         valid = True
     else:
@@ -278,6 +283,8 @@ def create_graph(input_path: str) -> Graph:
             
             for state in states:
                 ret_graph.add_state(state)
+            
+            ret_graph.freeze()
     
     logger.info("create graph = {} success".format(ret_graph._name))
     return ret_graph
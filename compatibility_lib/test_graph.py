@@ -89,14 +89,124 @@ def test_create_graph(init_state, normal_state, final_state, transitions):
     assert (final_state in graph.get_states_list()) == True
     
     assert normal_state.get_name() == graph.get_state(normal_state.get_name()).get_name()
+    assert graph.get_state("unknown_state") == None
 
     
     graph.add_state(new_state)
     assert len(graph.get_states_list()) == 4
     assert (new_state in graph.get_states_list()) == True
+    assert graph.get_state(new_state.get_name()) == new_state
     
     graph.add_state(None)
     assert len(graph.get_states_list()) == 4
     
     
-    
\ No newline at end of file
+def test_graph_state_index():
+    state1 = State(name="state", type=StateType.INIT)
+    state2 = State(name="state", type=StateType.NORMAL)
+    states = [state1]
+    
+    graph = Graph(name="graph", states=states)
+    graph.add_state(state2)
+    
+    # the first state with the same name is returned
+    assert graph.get_state("state") is state1
+    
+    # the graph does not share the list of the caller
+    states.append(State(name="other_state", type=StateType.FINAL))
+    assert len(graph.get_states_list()) == 2
+
+
+def test_freeze_graph(transitions):
+    state1 = State(name="state_1",
+                  type=StateType.INIT,
+                  outgoing= [transitions[0], transitions[1]]
+                  )
+    state2 = State(name="next_state_1",
+                  type=StateType.NORMAL,
+                  outgoing= [transitions[2], transitions[3]]
+                  )
+    graph = Graph(name="graph", states=[state1, state2])
+    
+    assert graph.is_frozen() == False
+    graph.freeze()
+    assert graph.is_frozen() == True
+    
+    assert graph.get_state_index("state_1") == 0
+    assert graph.get_state_index("next_state_1") == 1
+    
+    emissions = graph.outgoing_of_type(1, TransitionType.EMISSION)
+    assert len(emissions) == 1
+    assert graph.get_edge(emissions[0]) == transitions[2]
+    
+    receptions = graph.outgoing_of_type(0, TransitionType.RECEPTION)
+    assert len(receptions) == 1
+    assert graph.get_edge(receptions[0]) == transitions[1]
+    
+    assert len(graph.outgoing_of_type(0, TransitionType.TAU)) == 0
+    
+    graph.add_state(None)
+    assert graph.is_frozen() == True
+    graph.add_state(State(name="state_3", type=StateType.FINAL))
+    assert graph.is_frozen() == False
+    
+    graph.freeze()
+    state2.add_outgoing_transition(Transition(name="new_transition",
+                                              next_state="state_3",
+                                              type=TransitionType.EMISSION))
+    assert graph.is_frozen() == False
+    
+    # the view is rebuilt on use
+    emissions = graph.outgoing_of_type(1, TransitionType.EMISSION)
+    assert len(emissions) == 2
+    assert graph.is_frozen() == True
+    
+    offsets, dst, types, name_ids = graph.get_csr()
+    assert dst[emissions[1]] == 2
+    
+    
+def test_csr_name_ids(transitions):
+    graph1 = Graph(name="graph1",
+                   states=[State(name="state", type=StateType.INIT,
+                                 outgoing=[transitions[0], transitions[1]])])
+    graph2 = Graph(name="graph2",
+                   states=[State(name="state", type=StateType.INIT,
+                                 outgoing=[transitions[1], transitions[2]])])
+    
+    # ids are local to a graph by default
+    assert graph1.get_csr()[3].tolist() == [0, 1]
+    assert graph2.get_csr()[3].tolist() == [0, 1]
+    
+    name_ids = {}
+    name_ids1 = graph1.get_csr(name_ids)[3]
+    name_ids2 = graph2.get_csr(name_ids)[3]
+    
+    assert name_ids1[1] == name_ids2[0]
+    assert len(set(name_ids1) | set(name_ids2)) == 3
+    assert len(name_ids) == 3
+
+
+def test_graph_to_igraph(transitions):
+    igraph = pytest.importorskip("igraph")
+    
+    state1 = State(name="state_1",
+                  type=StateType.INIT,
+                  outgoing= [transitions[0], transitions[1]]
+                  )
+    state2 = State(name="next_state_1",
+                  type=StateType.FINAL,
+                  incoming= [transitions[0]]
+                  )
+    graph = Graph(name="graph", states=[state1, state2])
+    
+    ig_graph = graph.to_igraph()
+    
+    assert ig_graph.is_directed() == True
+    assert ig_graph.vs["name"] == ["state_1", "next_state_1"]
+    assert ig_graph.vs["type"] == [StateType.INIT, StateType.FINAL]
+    # transition 2 goes to a state which is not in the graph
+    assert ig_graph.ecount() == 1
+    assert ig_graph.es[0].tuple == (0, 1)
+    assert ig_graph.es[0]["name"] == transitions[0].name
+    assert ig_graph.es[0]["ttype"] == TransitionType.EMISSION
+    assert ig_graph.es[0]["params"] == transitions[0].params
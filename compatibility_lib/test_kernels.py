@@ -0,0 +1,134 @@
+__author__ = "Quang Hai, Nguyen"
+__copyright__ = "Copyright 2023, Protocol Compatibility Measurement"
+__credits__ = ["Quang Hai, Nguyen"]
+__license__ = "GPL"
+__version__ = "0.0.1"
+__maintainer__ = "Quang Hai"
+__email__ = "hai.nguyen.quang@outlook.com"
+__status__ = "Development"
+
+"""Unit test for _kernels.py module
+"""
+
+import pytest
+import importlib
+import sys
+from .graph import Transition, TransitionType
+from .graph import State, StateType
+from .graph import Graph
+from . import _kernels
+from ._kernels import bfs_match, bfs_match_graphs
+
+
+@pytest.fixture
+def graphs() -> tuple:
+    client = Graph(name="client",
+                   states=[State(name="c0", type=StateType.INIT,
+                                 outgoing=[Transition(name="request",
+                                                      next_state="c1",
+                                                      type=TransitionType.EMISSION)]),
+                           State(name="c1", type=StateType.NORMAL,
+                                 outgoing=[Transition(name="response",
+                                                      next_state="c0",
+                                                      type=TransitionType.RECEPTION)]),
+                           State(name="c2", type=StateType.FINAL)])
+    server = Graph(name="server",
+                   states=[State(name="s0", type=StateType.INIT,
+                                 outgoing=[Transition(name="request",
+                                                      next_state="s1",
+                                                      type=TransitionType.RECEPTION),
+                                           Transition(name="unknown",
+                                                      next_state="s2",
+                                                      type=TransitionType.EMISSION)]),
+                           State(name="s1", type=StateType.NORMAL,
+                                 outgoing=[Transition(name="response",
+                                                      next_state="s0",
+                                                      type=TransitionType.EMISSION)]),
+                           State(name="s2", type=StateType.FINAL)])
+    return (client, server)
+
+
+def test_bfs_match(graphs):
+    client, server = graphs
+    
+    name_ids = {}
+    pairs = bfs_match(*client.get_csr(name_ids), *server.get_csr(name_ids),
+                      client.get_state_index("c0"), server.get_state_index("s0"))
+    
+    assert pairs.tolist() == [[0, 0], [1, 1]]
+
+
+def test_bfs_match_graphs(graphs):
+    client, server = graphs
+    
+    pairs = bfs_match_graphs(client, server, "c0", "s0")
+    assert pairs.tolist() == [[0, 0], [1, 1]]
+    
+    pairs = bfs_match_graphs(client, server, 1, 1)
+    assert pairs.tolist() == [[1, 1], [0, 0]]
+
+
+def test_bfs_match_graphs_invalid_start(graphs):
+    client, server = graphs
+    
+    with pytest.raises(ValueError):
+        bfs_match_graphs(client, server, "unknown", "s0")
+    
+    with pytest.raises(ValueError):
+        bfs_match_graphs(client, server, 5, 7)
+    
+    with pytest.raises(ValueError):
+        bfs_match_graphs(client, server, 0, -1)
+
+
+def test_bfs_match_graphs_empty_graph(graphs):
+    client, _ = graphs
+    
+    pairs = bfs_match_graphs(client, Graph(name="empty"), "c0", 0)
+    assert pairs.shape == (0, 2)
+
+
+def test_bfs_match_tau(graphs):
+    client, server = graphs
+    client.get_state("c1").add_outgoing_transition(Transition(name="timeout",
+                                                              next_state="c2",
+                                                              type=TransitionType.TAU))
+    server.get_state("s1").add_outgoing_transition(Transition(name="timeout",
+                                                              next_state="s2",
+                                                              type=TransitionType.TAU))
+    
+    pairs = bfs_match_graphs(client, server, "c0", "s0")
+    
+    # tau moves only one of the graphs, they are never matched with each other
+    assert pairs.tolist() == [[0, 0], [1, 1], [2, 1], [1, 2], [2, 2]]
+
+
+def test_bfs_match_unknown_next_state(graphs):
+    client, server = graphs
+    client.get_state("c0").add_outgoing_transition(Transition(name="request",
+                                                              next_state="unknown",
+                                                              type=TransitionType.EMISSION))
+    server.get_state("s0").add_outgoing_transition(Transition(name="tau",
+                                                              next_state="unknown",
+                                                              type=TransitionType.TAU))
+    
+    assert -1 in client.get_csr()[1]
+    assert -1 in server.get_csr()[1]
+    
+    pairs = bfs_match_graphs(client, server, "c0", "s0")
+    assert pairs.tolist() == [[0, 0], [1, 1]]
+
+
+def test_bfs_match_without_numba(graphs, monkeypatch):
+    client, server = graphs
+    
+    monkeypatch.setitem(sys.modules, "numba", None)
+    try:
+        kernels = importlib.reload(_kernels)
+        assert not hasattr(kernels.bfs_match, "py_func")
+        
+        pairs = kernels.bfs_match_graphs(client, server, "c0", "s0")
+        assert pairs.tolist() == [[0, 0], [1, 1]]
+    finally:
+        monkeypatch.undo()
+        importlib.reload(_kernels)
@@ -11,8 +11,10 @@ __status__ = "Development"
 """
 
 import pytest
+import logging
 from .graph import Transition, TransitionType
 from .graph import State, StateType
+from .graph import InitHasIncomingError, FinalHasOutgoingError
 
 
 
@@ -76,6 +78,8 @@ def test_create_normal_state(normal_state:State, transitions):
     assert normal_state.is_initial_state() == False
     assert normal_state.get_num_of_incoming_transistions() == 2
     assert normal_state.get_num_of_outgoing_transitions() == 2
+    assert normal_state.num_incoming == 2
+    assert normal_state.num_outgoing == 2
     
     test_incoming = normal_state.get_incoming_transitions_list()
     assert incoming == test_incoming
@@ -106,6 +110,8 @@ def test_get_transition(normal_state:State, transitions):
     assert transitions[1] == normal_state.get_incoming_transtition(transitions[1].name)
     assert transitions[2] == normal_state.get_outgoing_transtition(transitions[2].name)
     assert transitions[3] == normal_state.get_outgoing_transtition(transitions[3].name)
+    assert normal_state.get_incoming_transtition(transitions[2].name) == None
+    assert normal_state.get_outgoing_transtition("unknown_transition") == None
     
     
 def test_get_emision_transition(normal_state:State, transitions):
@@ -123,6 +129,23 @@ def test_get_reception_transition(normal_state:State, transitions):
     
     
 
+def test_get_tau_transition(normal_state:State, transitions):
+    assert normal_state.get_outgoing_tau_list() == ()
+    assert normal_state.get_imcoming_tau_list() == ()
+    
+    tau_transition = Transition(name="tau_transition",
+                            next_state="tau_transition_next",
+                            type=TransitionType.TAU)
+    
+    normal_state.add_outgoing_transition(tau_transition)
+    normal_state.add_incoming_transition(tau_transition)
+    
+    assert normal_state.get_outgoing_tau_list() == (tau_transition,)
+    assert normal_state.get_imcoming_tau_list() == (tau_transition,)
+    assert normal_state.get_outgoing_emission_list() == (transitions[2],)
+    assert normal_state.get_outgoing_reception_list() == (transitions[3],)
+    
+
 def test_set_transition(normal_state:State, transitions):
     new_transition = Transition(name="new_transition",
                             next_state="new_transition_next",
@@ -150,8 +173,40 @@ def test_set_transition(normal_state:State, transitions):
     assert normal_state.get_num_of_outgoing_transitions() == 3
     
     
+def test_add_duplicated_transition(normal_state:State, transitions):
+    normal_state.add_incoming_transition(transitions[0])
+    assert normal_state.num_incoming == 2
+    
+    normal_state.add_outgoing_transition(transitions[2])
+    assert normal_state.num_outgoing == 2
+    
+    same_name_transition = Transition(name=transitions[3].name,
+                            next_state=transitions[3].next_state,
+                            type=TransitionType.RECEPTION)
+    normal_state.add_outgoing_transition(same_name_transition)
+    assert normal_state.num_outgoing == 2
+    
+    # same name and next state, but the opposite direction
+    opposite_transition = Transition(name=transitions[3].name,
+                            next_state=transitions[3].next_state,
+                            type=TransitionType.EMISSION)
+    normal_state.add_outgoing_transition(opposite_transition)
+    assert normal_state.num_outgoing == 3
+    
+    # same name and next state, but coming from another state
+    normal_state.add_incoming_transition(same_name_transition)
+    assert normal_state.num_incoming == 3
+    
+    
+def test_add_duplicated_transition_warning(normal_state:State, transitions, caplog):
+    with caplog.at_level(logging.WARNING, logger="GRAPH"):
+        normal_state.add_outgoing_transition(transitions[2])
+    
+    assert "ignore duplicated outgoing transition" in caplog.text
+    
+    
 def test_create_init_state_fail(transitions):
-    with pytest.raises(Exception):
+    with pytest.raises(InitHasIncomingError):
         state = State(name="test_state",
                   type=StateType.INIT,
                   incoming= [transitions[0], transitions[1]],
@@ -160,7 +215,7 @@ def test_create_init_state_fail(transitions):
      
         
 def test_create_final_state_fail(transitions):
-    with pytest.raises(Exception):
+    with pytest.raises(FinalHasOutgoingError):
         state = State(name="test_state",
                   type=StateType.FINAL,
                   incoming= [transitions[0], transitions[1]],
@@ -185,5 +240,13 @@ def test_add_outgoing_transition_to_final_state(final_state, transitions):
                             type=TransitionType.RECEPTION,
                             params=["param1:type1", "param2:type2"])
     
-    with pytest.raises(Exception):
-        final_state.add_outgoing_transition(new_transition)
\ No newline at end of file
+    with pytest.raises(FinalHasOutgoingError):
+        final_state.add_outgoing_transition(new_transition)
+
+def test_state_report(normal_state, transitions):
+    report = normal_state.get_report().split("\n")
+    
+    assert report[2] == "Name: test_state"
+    assert report[3] == "Type: StateType.NORMAL"
+    assert report.count("    Name: {}".format(transitions[0].name)) == 1
+    assert report.count("        param3:type3") == 2
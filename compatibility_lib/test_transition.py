@@ -12,6 +12,7 @@ __status__ = "Development"
 
 import pytest
 from .graph import Transition, TransitionType
+from .graph import IllegalTauParamsError, IllegalParamError
 
 
 
@@ -28,12 +29,15 @@ def test_create_normal_transition(normal_transition:Transition):
     assert normal_transition.name == "test_transition"
     assert normal_transition.next_state == "next_state"
     assert normal_transition.type == TransitionType.EMISSION
+    assert "{}".format(normal_transition.type) == "TransitionType.EMISSION"
+    assert str(normal_transition.type) == "TransitionType.EMISSION"
     
     assert normal_transition.get_param_type("param1") == "type1"
     assert normal_transition.get_param_type("param2") == "type2"
     assert normal_transition.get_param_type("param3") == "type3"
     assert normal_transition.get_param_type("param4") == None
     assert normal_transition.get_param_type("param5") == None
+    assert normal_transition.get_param_type("param") == None
 
 
 def test_get_type_normal_transition(normal_transition:Transition):    
@@ -47,10 +51,28 @@ def test_get_type_normal_transition(normal_transition:Transition):
 def test_get_type_no_diplicate_normal_transition(normal_transition:Transition):    
     types = normal_transition.get_data_types()
     assert len(types) == len(set(types))
+    
+    transition = Transition(name="test_transition",
+                            next_state="next_state",
+                            type=TransitionType.EMISSION,
+                            params=["param1:type2", "param2:type1", "param3:type2"])
+    assert transition.get_data_types() == ["type2", "type1"]
+
+
+def test_create_transition_with_tuple_params(normal_transition:Transition):
+    transition = Transition(name="test_transition",
+                            next_state="next_state",
+                            type=TransitionType.EMISSION,
+                            params=[("param1", "type1"), ("param2", "type2"), ("param3", "type3")])
+    
+    assert transition.params == normal_transition.params
+    assert transition.params[0] == ("param1", "type1")
+    assert transition.get_param_type("param2") == "type2"
+    assert transition.get_data_types() == ["type1", "type2", "type3"]
 
 
 def test_create_tau_transition_with_no_empty_params():
-    with pytest.raises(Exception):
+    with pytest.raises(IllegalTauParamsError):
         tau_transition = Transition(name="test_transition",
                                     next_state="next_state",
                                     type=TransitionType.TAU,
@@ -61,4 +83,24 @@ def test_create_tau_transition_with_empty_params():
     tau_transition = Transition(name="test_transition",
                                 next_state="next_state",
                                 type=TransitionType.TAU)
-    assert tau_transition.params == []
\ No newline at end of file
+    assert tau_transition.params == ()
+
+
+def test_create_transition_with_illegal_params():
+    with pytest.raises(IllegalParamError, match="param2"):
+        Transition(name="test_transition",
+                   next_state="next_state",
+                   type=TransitionType.EMISSION,
+                   params=["param1:type1", "param2"])
+    
+    with pytest.raises(IllegalParamError, match="param2"):
+        Transition(name="test_transition",
+                   next_state="next_state",
+                   type=TransitionType.EMISSION,
+                   params=[("param1", "type1"), ("param2",)])
+    
+    transition = Transition(name="test_transition",
+                            next_state="next_state",
+                            type=TransitionType.EMISSION,
+                            params=[("param1", "type1"), "param2:type2"])
+    assert transition.params == (("param1", "type1"), ("param2", "type2"))